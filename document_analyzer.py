@@ -1,33 +1,141 @@
 import os
 import re
+import shutil
+import subprocess
+import zipfile
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pypdf import PdfReader
-from docx import Document
+from lxml import etree
 import nltk
-from nltk.tokenize import word_tokenize
-from nltk import pos_tag
+from nltk.tokenize import PunktTokenizer, NLTKWordTokenizer
+from nltk.tag import PerceptronTagger
+
+try:
+    import spacy
+    from spacy.tokens import Doc
+except ImportError:
+    spacy = None
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+# Tokens that count as words (compiled once, it runs on every token)
+_WORD_RE = re.compile(r'\w+')
+
+# PDFs longer than this are extracted in page batches of this size, in parallel
+PDF_PAGES_PER_TASK = 32
+
+# PyMuPDF extracts a page in about a millisecond, so worker processes only
+# pay for their startup on PDFs at least this long
+PYMUPDF_PARALLEL_MIN_PAGES = 256
+
+# WordprocessingML tags used when reading .docx files directly
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = _W_NS + "body"
+_W_PARAGRAPH = _W_NS + "p"
+_W_RUN = _W_NS + "r"
+_W_HYPERLINK = _W_NS + "hyperlink"
+_W_TEXT = _W_NS + "t"
+_W_BREAK = _W_NS + "br"
+_W_BREAK_TYPE = _W_NS + "type"
+# Other run content and its plain-text equivalent, as in python-docx
+_W_RUN_SYMBOLS = {
+    _W_NS + "tab": "\t",
+    _W_NS + "ptab": "\t",
+    _W_NS + "cr": "\n",
+    _W_NS + "noBreakHyphen": "-",
+}
+# Same hardening python-docx applies: never expand entities from the document
+_DOCX_PARSER = etree.XMLParser(resolve_entities=False)
+
+# Poppler's pdftotext binary, preferred for PDFs when it's on the PATH
+_PDFTOTEXT = shutil.which("pdftotext")
+PDFTOTEXT_TIMEOUT = 120
+
+# Written once every NLTK resource has been found or downloaded
+NLTK_SENTINEL = os.path.join(os.path.expanduser("~"), ".cache", "document_analyzer", "nltk_ok")
 
 # --- 1. Dedicated NLTK Setup Function ---
+def _nltk_sentinel_lines(resources):
+    """
+    What the sentinel records: the resources and the NLTK data path they were
+    found on, so another venv or NLTK_DATA setting checks again.
+    """
+    return list(resources) + list(nltk.data.path)
+
+def _nltk_sentinel_matches(resources):
+    """True if a previous run already confirmed these exact NLTK resources."""
+    try:
+        with open(NLTK_SENTINEL, encoding="utf-8") as sentinel:
+            return sentinel.read().splitlines() == _nltk_sentinel_lines(resources)
+    except OSError:
+        return False
+
+def _write_nltk_sentinel(resources):
+    """Records that the resources are installed, so later runs skip the checks."""
+    try:
+        os.makedirs(os.path.dirname(NLTK_SENTINEL), exist_ok=True)
+        with open(NLTK_SENTINEL, "w", encoding="utf-8") as sentinel:
+            sentinel.write("\n".join(_nltk_sentinel_lines(resources)))
+    except OSError:
+        # Not being able to cache this only costs us the checks next time
+        pass
+
+def _forget_nltk_sentinel():
+    """Removes the sentinel, so the next setup checks every resource again."""
+    try:
+        os.remove(NLTK_SENTINEL)
+    except OSError:
+        pass
+
+def _load_nltk_model(loader, *args):
+    """
+    Calls loader(*args). If its NLTK data has gone missing since the sentinel
+    was written (e.g. nltk_data was deleted), the sentinel is dropped, the
+    data downloaded again and the load retried once.
+    """
+    try:
+        return loader(*args)
+    except LookupError:
+        _forget_nltk_sentinel()
+        setup_nltk_resources()
+        return loader(*args)
+
 def setup_nltk_resources():
     """
-    Ensures all necessary NLTK data (punkt and averaged_perceptron_tagger) 
+    Ensures all necessary NLTK data (punkt_tab and averaged_perceptron_tagger_eng) 
     are downloaded before any NLP operations begin. This version is highly robust 
     against missing resources.
     """
-    resources_to_download = [
-        'punkt', 
-        'averaged_perceptron_tagger', 
-        # Including the specific English version as a backup check
-        'averaged_perceptron_tagger_eng' 
-    ]
+    # Resource name -> its location in the NLTK data directories. NLTK 3.9+
+    # loads only these two; the old pickled 'punkt' and tagger go unused.
+    resources_to_download = {
+        'punkt_tab': 'tokenizers/punkt_tab',
+        'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng',
+    }
+    
+    # Every nltk.data.find walks the NLTK data path, so skip them once confirmed
+    if _nltk_sentinel_matches(list(resources_to_download)):
+        return
     
     print("Checking and downloading NLTK resources...")
     
-    for resource_name in resources_to_download:
+    all_available = True
+    
+    for resource_name, resource_path in resources_to_download.items():
         try:
-            # Try to find the resource using its standard path (often just the name works)
-            # This check can sometimes fail even if the data is there, but we try it first.
-            nltk.data.find(f'taggers/{resource_name}') 
+            # Try to find the resource at its standard path
+            nltk.data.find(resource_path)
             # If find succeeds, we can skip the download printout
             # print(f"'{resource_name}' is already available.")
             continue
@@ -36,96 +144,346 @@ def setup_nltk_resources():
             print(f"Downloading required NLTK resource: '{resource_name}'...")
             try:
                 # Use quiet=True to minimize terminal spam
-                nltk.download(resource_name, quiet=True)
-                print(f"'{resource_name}' downloaded successfully.")
+                # download() reports most failures by returning False
+                if nltk.download(resource_name, quiet=True):
+                    print(f"'{resource_name}' downloaded successfully.")
+                else:
+                    all_available = False
             except Exception as e:
                 # This block handles critical download failures
                 print(f"FATAL ERROR: Could not download {resource_name}. Error: {e}")
                 # Re-raise the error to stop the program, as we can't proceed without it.
                 raise
 
+    if all_available:
+        _write_nltk_sentinel(list(resources_to_download))
+
     print("NLTK setup complete.")
 # ----------------------------------------------------
 
-def get_document_text(file_path):
-    """Extracts text from a PDF or DOCX file."""
+# --- 2. Optional spaCy Tagger ---
+def load_spacy_pipeline():
+    """
+    Loads spaCy's small English model with every component except the tagger
+    disabled. Returns None if spaCy or 'en_core_web_sm' is not installed, in
+    which case NLTK's perceptron tagger is used instead.
+    """
+    if spacy is None:
+        return None
+    try:
+        return spacy.load(
+            "en_core_web_sm",
+            disable=["parser", "ner", "lemmatizer", "attribute_ruler"]
+        )
+    except OSError:
+        # The spaCy package is present but the English model isn't
+        return None
+
+# Loaded once per process; spaCy model loading is far too slow to repeat per call
+_NLP = load_spacy_pipeline()
+
+# spaCy tags token lists as Docs of SPACY_DOC_WORDS words, SPACY_BATCH_SIZE at a time
+SPACY_DOC_WORDS = 1000
+SPACY_BATCH_SIZE = 64
+
+# NLTK's word_tokenize/pos_tag rebuild these models on every call, so we keep
+# our own instances. They are created on first use, once the NLTK data exists.
+_WORD_TOKENIZER = NLTKWordTokenizer()
+
+@lru_cache(maxsize=1)
+def _get_sent_tokenizer():
+    """Returns the shared Punkt sentence tokenizer, loading it on first use."""
+    return _load_nltk_model(PunktTokenizer, "english")
+
+def _tokenize(text):
+    """Same output as nltk.word_tokenize, reusing a single Punkt model."""
+    return [
+        token
+        for sentence in _get_sent_tokenizer().tokenize(text)
+        for token in _WORD_TOKENIZER.tokenize(sentence)
+    ]
+
+@lru_cache(maxsize=1)
+def _get_tagger():
+    """Returns the shared perceptron tagger, loading its model on first use."""
+    return _load_nltk_model(PerceptronTagger)
+
+def _tag_tokens(tokens):
+    """
+    POS-tags an already tokenized list of words. Both backends return
+    Penn Treebank tags (JJ, JJR, JJS, ...) as (word, tag) tuples.
+    """
+    if _NLP is not None:
+        # Feed NLTK's tokens straight in so word counts don't depend on the backend,
+        # as a stream of fixed-size Docs that nlp.pipe tags in batches
+        docs = (
+            Doc(_NLP.vocab, words=tokens[i:i + SPACY_DOC_WORDS])
+            for i in range(0, len(tokens), SPACY_DOC_WORDS)
+        )
+        return [
+            (token.text, token.tag_)
+            for doc in _NLP.pipe(docs, batch_size=SPACY_BATCH_SIZE)
+            for token in doc
+        ]
+    return _get_tagger().tag(tokens)
+# ----------------------------------------------------
+
+def _extract_pdf_pages(file_path, start, end):
+    """Extracts the text of pages [start, end) of a PDF (runs in a worker process)."""
+    reader = PdfReader(file_path)
+    return [reader.pages[i].extract_text() for i in range(start, end)]
+
+def _pymupdf_page_text(page):
+    """
+    A PyMuPDF page's text. Joining its text blocks (block type 0) gives the
+    same string as get_text("text"), but MuPDF hands the blocks back without
+    assembling the page string line by line, which is measurably faster.
+    """
+    return "".join(block[4] for block in page.get_text("blocks") if block[6] == 0)
+
+def _extract_pdf_pages_pymupdf(file_path, start, end):
+    """Same as _extract_pdf_pages, with PyMuPDF (runs in a worker process)."""
+    with pymupdf.open(file_path) as pdf:
+        return [_pymupdf_page_text(pdf[i]) for i in range(start, end)]
+
+def _iter_pdf_parallel(extract_pages, file_path, page_count):
+    """
+    Yields a PDF's page texts in page order, extracted by extract_pages in
+    batches of PDF_PAGES_PER_TASK pages across worker processes. Each worker
+    opens its own document; pypdf is pure Python and a document handle can't
+    be shared between threads, so threads would gain nothing here.
+    """
+    starts = range(0, page_count, PDF_PAGES_PER_TASK)
+    ends = [min(start + PDF_PAGES_PER_TASK, page_count) for start in starts]
+    workers = min(len(starts), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch in executor.map(extract_pages, repeat(file_path), starts, ends):
+            yield from batch
+
+def _extract_pdf_pdftotext(file_path):
+    """
+    Extracts the text of every PDF page with Poppler's pdftotext, which
+    separates pages with form feeds. Returns None if the binary fails or
+    times out, so one of the Python backends can take over.
+    """
+    # An absolute path can't be mistaken for a command line option. UTF-8 is
+    # requested explicitly: xpdf's pdftotext defaults to Latin-1
+    command = [_PDFTOTEXT, "-q", "-enc", "UTF-8", os.path.abspath(file_path), "-"]
+    try:
+        result = subprocess.run(command, capture_output=True, timeout=PDFTOTEXT_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.decode("utf-8", "replace").split("\f")
+
+def _iter_pdf_pymupdf(file_path):
+    """Yields the text of each PDF page with PyMuPDF, in parallel for very long PDFs."""
+    with pymupdf.open(file_path) as pdf:
+        page_count = pdf.page_count
+        if page_count < PYMUPDF_PARALLEL_MIN_PAGES or (os.cpu_count() or 1) == 1:
+            for page in pdf:
+                yield _pymupdf_page_text(page)
+            return
+    yield from _iter_pdf_parallel(_extract_pdf_pages_pymupdf, file_path, page_count)
+
+def _iter_pdf_pdfium(file_path):
+    """Yields the text of each PDF page with PDFium."""
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            yield page_text
+    finally:
+        pdf.close()
+
+def _iter_pdf_pypdf(file_path):
+    """Yields the text of each PDF page with pypdf, in parallel for long PDFs."""
+    reader = PdfReader(file_path)
+    page_count = len(reader.pages)
+    if page_count > PDF_PAGES_PER_TASK and (os.cpu_count() or 1) > 1:
+        yield from _iter_pdf_parallel(_extract_pdf_pages, file_path, page_count)
+    else:
+        for page in reader.pages:
+            yield page.extract_text()
+
+def _iter_pdf_pages(file_path):
+    """
+    Yields the text of each PDF page using the fastest installed backend:
+    the pdftotext binary, PyMuPDF, PDFium (all native code), then pypdf.
+    """
+    if _PDFTOTEXT is not None:
+        pages_text = _extract_pdf_pdftotext(file_path)
+        if pages_text is not None:
+            yield from pages_text
+            return
+    if pymupdf is not None:
+        yield from _iter_pdf_pymupdf(file_path)
+    elif pdfium is not None:
+        yield from _iter_pdf_pdfium(file_path)
+    else:
+        yield from _iter_pdf_pypdf(file_path)
+
+def _run_text(run):
+    """Text of one w:r element, from its direct children only."""
+    pieces = []
+    for node in run:
+        if node.tag == _W_TEXT:
+            pieces.append(node.text or "")
+        elif node.tag == _W_BREAK:
+            # Line breaks become newlines; page and column breaks add nothing
+            if node.get(_W_BREAK_TYPE, "textWrapping") == "textWrapping":
+                pieces.append("\n")
+        else:
+            pieces.append(_W_RUN_SYMBOLS.get(node.tag, ""))
+    return "".join(pieces)
+
+def _paragraph_text(paragraph):
+    """
+    Text of one w:p element, the way python-docx's paragraph.text reads it:
+    only runs directly in the paragraph or in its hyperlinks. Text boxes
+    (w:txbxContent) and mc:AlternateContent fallbacks sit deeper inside
+    drawing runs and are not part of the paragraph's text.
+    """
+    pieces = []
+    for child in paragraph.iterchildren(_W_RUN, _W_HYPERLINK):
+        if child.tag == _W_RUN:
+            pieces.append(_run_text(child))
+        else:
+            pieces.extend(_run_text(run) for run in child.iterchildren(_W_RUN))
+    return "".join(pieces)
+
+def _iter_docx_paragraphs(file_path):
+    """
+    Yields the body paragraphs straight out of word/document.xml, skipping
+    python-docx's per-paragraph Paragraph/Run object layer.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open("word/document.xml") as document_xml:
+            root = etree.parse(document_xml, _DOCX_PARSER).getroot()
+    body = root.find(_W_BODY)
+    if body is None:
+        return
+    for paragraph in body.iterchildren(_W_PARAGRAPH):
+        yield _paragraph_text(paragraph)
+
+class DocumentReadError(Exception):
+    """A document couldn't be read; the message is ready to show to the user."""
+
+def iter_document_text(file_path):
+    """
+    Yields the non-empty text of a PDF page by page, or of a DOCX paragraph
+    by paragraph, so callers can process a document without ever holding its
+    full text. Raises DocumentReadError if the file can't be read.
+    """
     if not os.path.exists(file_path):
-        return f"Error: File not found at path: {file_path}"
+        raise DocumentReadError(f"Error: File not found at path: {file_path}")
         
     _, file_extension = os.path.splitext(file_path)
-    text = ""
 
     if file_extension.lower() == '.pdf':
-        try:
-            reader = PdfReader(file_path)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + '\n'
-        except Exception as e:
-            return f"Error reading PDF: {e}"
-
+        file_type, pieces = "PDF", _iter_pdf_pages(file_path)
     elif file_extension.lower() == '.docx':
-        try:
-            doc = Document(file_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + '\n'
-        except Exception as e:
-            return f"Error reading DOCX: {e}"
-
+        file_type, pieces = "DOCX", _iter_docx_paragraphs(file_path)
     else:
-        return f"Unsupported file type: {file_extension}. Please use .pdf or .docx"
+        raise DocumentReadError(f"Unsupported file type: {file_extension}. Please use .pdf or .docx")
+
+    try:
+        for piece in pieces:
+            if piece:
+                yield piece
+    except Exception as e:
+        raise DocumentReadError(f"Error reading {file_type}: {e}") from e
 
-    return text
+def get_document_text(file_path):
+    """Extracts text from a PDF or DOCX file."""
+    try:
+        # join() builds the result once; += on a growing str is quadratic
+        return "\n".join(iter_document_text(file_path))
+    except DocumentReadError as e:
+        return str(e)
 
 def analyze_text(text):
     """
     Performs word count and adjective frequency analysis using POS tagging.
     """
-    # 1. Tokenization (Requires 'punkt')
-    tokens = word_tokenize(text)
-    
-    # Filter for words only (basic cleaning using regex)
-    words = [word.lower() for word in tokens if re.fullmatch(r'\w+', word)]
-    total_word_count = len(words)
+    # Nothing to count, so don't bother the tokenizer and tagger
+    if not text or text.isspace():
+        return 0, []
 
-    # 2. Part-of-Speech Tagging (Requires 'averaged_perceptron_tagger')
-    tagged_words = pos_tag(tokens)
-    
+    # 1. Tokenization (Requires 'punkt_tab')
+    return analyze_tokens(_tokenize(text))
 
-    # Filter for adjectives. 'JJ' tags indicate adjectives (JJ, JJR, JJS)
-    adjectives = [word.lower() for word, tag in tagged_words if tag.startswith('JJ')]
+def analyze_tokens(tokens):
+    """
+    Same analysis as analyze_text, for text that has already been tokenized,
+    so callers holding a token list never pay for tokenizing it again.
+    """
+    if not tokens:
+        return 0, []
 
-    # 3. Adjective Scoreboard
+    # 2. Part-of-Speech Tagging (spaCy if installed, else 'averaged_perceptron_tagger_eng')
+    tagged_words = _tag_tokens(tokens)
+
+    # Count words (basic cleaning using regex) and adjectives in a single pass.
+    # 'JJ' tags indicate adjectives (JJ, JJR, JJS)
+    total_word_count = 0
+    adjectives = []
+    for word, tag in tagged_words:
+        # isalnum() settles most tokens in C; only the rest need the \w+ regex
+        if word.isalnum() or _WORD_RE.fullmatch(word):
+            total_word_count += 1
+        if tag.startswith('JJ'):
+            adjectives.append(word.lower())
+    # Counter() tallies a whole list in C, unlike per-word += 1 lookups
     adjective_counts = Counter(adjectives)
+
+    # 3. Adjective Scoreboard
     top_adjectives = adjective_counts.most_common(10)
 
     return total_word_count, top_adjectives
 
 def generate_markdown_report(word_count, top_adjectives, file_path):
     """Generates the analysis results in Markdown format."""
-    markdown = f"## 📄 Document Analysis Report\n\n"
-    markdown += f"**File Analyzed:** `{os.path.basename(file_path)}`\n\n"
-    markdown += "---\n\n"
+    # Build the report as a list of lines and join it once at the end
+    lines = [
+        "## 📄 Document Analysis Report",
+        "",
+        f"**File Analyzed:** `{os.path.basename(file_path)}`",
+        "",
+        "---",
+        "",
+    ]
     
     # 1. Total Word Count
-    markdown += f"### ✅ Total Word Count\n\n"
-    markdown += f"The document contains **{word_count:,}** words.\n\n"
+    lines += [
+        "### ✅ Total Word Count",
+        "",
+        f"The document contains **{word_count:,}** words.",
+        "",
+    ]
     
     # 2. Adjective Scoreboard
-    markdown += f"### 🏆 Top 10 Adjective Scoreboard\n\n"
+    lines += ["### 🏆 Top 10 Adjective Scoreboard", ""]
     
     if not top_adjectives:
-        markdown += "No adjectives were found in the document to display a scoreboard.\n"
+        lines.append("No adjectives were found in the document to display a scoreboard.")
     else:
         # Create a Markdown Table
-        markdown += "| Rank | Adjective | Count |\n"
-        markdown += "| :--- | :-------- | :---- |\n"
-        
-        for rank, (adjective, count) in enumerate(top_adjectives, 1):
-            markdown += f"| {rank} | **{adjective}** | {count} |\n"
+        lines.append("| Rank | Adjective | Count |")
+        lines.append("| :--- | :-------- | :---- |")
+        lines.extend(
+            f"| {rank} | **{adjective}** | {count} |"
+            for rank, (adjective, count) in enumerate(top_adjectives, 1)
+        )
             
-    return markdown
+    # Trailing "" keeps the final newline of the original report
+    lines.append("")
+    return "\n".join(lines)
 
 def main_app():
     """Main function to handle user input and run the application."""
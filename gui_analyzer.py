@@ -1,40 +1,32 @@
 import os
-import re
-import threading
+import queue
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 from collections import Counter
-from pypdf import PdfReader
-from docx import Document
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk import pos_tag
+
+# Text extraction, NLTK setup, tokenizing, tagging and the report format are
+# shared with the command-line analyzer
+from document_analyzer import (
+    _NLP,
+    _WORD_RE,
+    DocumentReadError,
+    _get_sent_tokenizer,
+    _get_tagger,
+    _tag_tokens,
+    _tokenize,
+    generate_markdown_report,
+    iter_document_text,
+    setup_nltk_resources,
+)
 
 # ==============================================================================
 # 1. CORE ANALYSIS & NLTK SETUP (from previous version)
 # ==============================================================================
 
-def setup_nltk_resources():
-    """Ensures necessary NLTK data are downloaded."""
-    resources_to_download = [
-        'punkt', 
-        'averaged_perceptron_tagger', 
-        'averaged_perceptron_tagger_eng' 
-    ]
-    
-    # Check if download is required before proceeding
-    for resource_name in resources_to_download:
-        try:
-            # Check for resource existence
-            nltk.data.find(f'taggers/{resource_name}') 
-        except LookupError:
-            # If not found, download it silently
-            try:
-                nltk.download(resource_name, quiet=True)
-            except Exception as e:
-                # If download fails, raise a critical error
-                raise Exception(f"Failed to download NLTK resource '{resource_name}': {e}")
-            
 # Run NLTK setup once at the start
 try:
     setup_nltk_resources()
@@ -44,87 +36,76 @@ except Exception as e:
     # We can't use Tkinter's messagebox yet, so print to terminal
     exit()
 
-def get_document_text(file_path):
-    """Extracts text from a PDF or DOCX file."""
-    # ... (Keep this function exactly the same as before) ...
-    if not os.path.exists(file_path):
-        return f"Error: File not found at path: {file_path}"
-        
-    _, file_extension = os.path.splitext(file_path)
-    text = ""
-
-    if file_extension.lower() == '.pdf':
-        try:
-            reader = PdfReader(file_path)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + '\n'
-        except Exception as e:
-            return f"Error reading PDF: {e}"
-
-    elif file_extension.lower() == '.docx':
-        try:
-            doc = Document(file_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + '\n'
-        except Exception as e:
-            return f"Error reading DOCX: {e}"
-
-    else:
-        return f"Unsupported file type: {file_extension}. Please use .pdf or .docx"
-
-    return text
+# Documents with fewer tokens than this are tagged in a single process
+PARALLEL_TAGGING_MIN_TOKENS = 50000
 
-# Insert this function into the CORE ANALYSIS section (Section 1)
+# Number of recently analyzed files whose reports are kept (see _analyze_file)
+ANALYSIS_CACHE_SIZE = 32
 
-def split_text_into_chapters(text, max_chunks=3):
-    """Splits the text into a maximum number of chunks (chapters) based on word count."""
-    tokens = word_tokenize(text)
+def split_tokens(tokens, max_chunks=3):
+    """
+    Splits a token list into a maximum number of chunks (chapters) based on
+    word count. Returns (start, end) index ranges into the token list.
+    """
     total_words = len(tokens)
     
-    # Calculate target words per chunk
-    target_size = max(1, total_words // max_chunks)
+    # Evenly spaced chapter boundaries, so chapter sizes differ by at most one word
+    boundaries = [i * total_words // max_chunks for i in range(max_chunks + 1)]
+    
+    # Documents shorter than max_chunks words would otherwise get empty chapters
+    return [
+        (start, end)
+        for start, end in zip(boundaries, boundaries[1:])
+        if end > start
+    ]
+
+def _tag_chapters(tokens, chapter_ranges):
+    """
+    POS-tags each chapter's tokens. Tagging is CPU-bound Python, so large
+    documents are spread over worker processes instead of threads.
+    """
+    chapter_tokens = [tokens[start:end] for start, end in chapter_ranges]
+    workers = min(len(chapter_tokens), os.cpu_count() or 1)
     
-    chapter_chunks = []
-    current_chunk = []
+    # Small documents aren't worth the cost of starting the workers
+    if workers < 2 or len(tokens) < PARALLEL_TAGGING_MIN_TOKENS:
+        return [_tag_tokens(chunk) for chunk in chapter_tokens]
     
-    # Iterate through tokens, splitting when the target size is reached
-    for token in tokens:
-        current_chunk.append(token)
-        if len(current_chunk) >= target_size and len(chapter_chunks) < max_chunks - 1:
-            chapter_chunks.append(" ".join(current_chunk))
-            current_chunk = []
-
-    # Add the remaining text as the last chapter
-    if current_chunk:
-        chapter_chunks.append(" ".join(current_chunk))
-        
-    return chapter_chunks
+    # Each worker loads its own tagger on first use; only token lists are sent over
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_tag_tokens, chapter_tokens))
 
 def analyze_by_chapter(document_text, file_path):
     """
     Splits the document, analyzes each part, and generates a dictionary
     of reports keyed by chapter name.
     """
-    chapter_texts = split_text_into_chapters(document_text)
+    # The only tokenization pass: chapters and the summary all share these tokens
+    tokens = _tokenize(document_text)
+    chapter_ranges = split_tokens(tokens)
+    chapter_tags = _tag_chapters(tokens, chapter_ranges)
+    chapter_counts = [_count_tagged(tags) for tags in chapter_tags]
     chapter_reports = {}
     
-    # General document-wide report
-    word_count_total, top_adjectives_total = analyze_text(document_text)
+    # General document-wide report, merged from the chapter counts rather than
+    # recounted (Counter.update keeps first-seen order, so ties rank the same)
+    word_count_total = 0
+    adjective_counts_total = Counter()
+    for word_count, adjective_counts in chapter_counts:
+        word_count_total += word_count
+        adjective_counts_total.update(adjective_counts)
     chapter_reports["Full Document Summary"] = generate_markdown_report(
-        word_count_total, top_adjectives_total, file_path
+        word_count_total, adjective_counts_total.most_common(10), file_path
     )
     
     # Analyze and report for each chapter
-    for i, chapter_text in enumerate(chapter_texts, 1):
+    for i, (word_count, adjective_counts) in enumerate(chapter_counts, 1):
         chapter_name = f"Chapter {i}"
         
-        # Run the existing analysis functions on the chapter text
-        word_count, top_adjectives = analyze_text(chapter_text)
-        
         # Generate a modified report for the chapter
-        report_content = generate_markdown_report(word_count, top_adjectives, file_path)
+        report_content = generate_markdown_report(
+            word_count, adjective_counts.most_common(10), file_path
+        )
         
         # Optionally, modify the report header for the chapter report
         chapter_report = report_content.replace(
@@ -136,46 +117,82 @@ def analyze_by_chapter(document_text, file_path):
         
     return chapter_reports
 
-def analyze_text(text):
-    """Performs word count and adjective frequency analysis."""
-    tokens = word_tokenize(text)
-    words = [word.lower() for word in tokens if re.fullmatch(r'\w+', word)]
-    total_word_count = len(words)
-
-    # Part-of-Speech Tagging
-    tagged_words = pos_tag(tokens)
-
-    # Filter for adjectives. 'JJ' tags indicate adjectives
-    adjectives = [word.lower() for word, tag in tagged_words if tag.startswith('JJ')]
+def _count_tagged(tagged_words):
+    """Word count and adjective Counter for an already POS-tagged token list."""
+    # Count words and adjectives in a single pass. 'JJ' tags indicate adjectives
+    total_word_count = 0
+    adjectives = []
+    for word, tag in tagged_words:
+        # isalnum() settles most tokens in C; only the rest need the \w+ regex
+        if word.isalnum() or _WORD_RE.fullmatch(word):
+            total_word_count += 1
+        if tag.startswith('JJ'):
+            adjectives.append(word.lower())
+    # Counter() tallies a whole list in C, unlike per-word += 1 lookups
+    return total_word_count, Counter(adjectives)
+
+def warm_up_analysis():
+    """
+    Loads the Punkt and tagger models ahead of the first analysis, so that
+    cost overlaps with the user picking a file instead of the progress screen.
+    """
+    _get_sent_tokenizer()
+    if _NLP is None:
+        _get_tagger()
 
-    # Adjective Scoreboard
-    adjective_counts = Counter(adjectives)
-    top_adjectives = adjective_counts.most_common(10)
+def _start_analysis_process():
+    """
+    Initializer of the analysis process. On POSIX it becomes the leader of its
+    own process group, which the chapter tagging and PDF extraction pools it
+    starts inherit, so closing the window can stop them all with one signal.
+    """
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
 
-    return total_word_count, top_adjectives
+def _terminate_analysis_process(process):
+    """Stops an analysis process together with any pools it has started."""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            return
+        except OSError:
+            pass # Not a group leader yet (or already gone); fall back below
+    process.terminate()
 
-def generate_markdown_report(word_count, top_adjectives, file_path):
-    """Generates the analysis results in Markdown format."""
-    # ... (Keep this function exactly the same as before) ...
-    markdown = f"## 📄 Document Analysis Report\n\n"
-    markdown += f"**File Analyzed:** `{os.path.basename(file_path)}`\n\n"
-    markdown += "---\n\n"
-    
-    markdown += f"### ✅ Total Word Count\n\n"
-    markdown += f"The document contains **{word_count:,}** words.\n\n"
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _analyze_file(file_path, stamp):
+    """
+    Extracts and analyzes a document. Memoized on (path, (mtime, size)), so
+    re-analyzing an unchanged file skips extraction and tagging entirely.
+    Failures raise and are therefore never cached.
+    """
+    # 1. Extract Text. The pages/paragraphs are joined before tokenizing, as
+    #    in the CLI: Punkt decides sentence ends across piece breaks, so a
+    #    token like "etc." at the end of a page is split the same way
+    document_text = "\n".join(iter_document_text(file_path))
     
-    markdown += f"### 🏆 Top 10 Adjective Scoreboard\n\n"
+    # 2. Analyze Text and Generate Chapter Reports
+    return analyze_by_chapter(document_text, file_path)
+
+def analyze_document(file_path):
+    """
+    Extracts and analyzes a document, returning (chapter_reports, error_msg)
+    with exactly one of the two set. Runs in the GUI's analysis process.
+    """
+    try:
+        st = os.stat(file_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None # iter_document_text reports the missing file
     
-    if not top_adjectives:
-        markdown += "No adjectives were found in the document to display a scoreboard.\n"
-    else:
-        markdown += "| Rank | Adjective | Count |\n"
-        markdown += "| :--- | :-------- | :---- |\n"
+    try:
+        return _analyze_file(file_path, stamp), None
         
-        for rank, (adjective, count) in enumerate(top_adjectives, 1):
-            markdown += f"| {rank} | **{adjective}** | {count} |\n"
-            
-    return markdown
+    except DocumentReadError as e:
+        return None, str(e)
+    except Exception as e:
+        # Analysis failed due to an unexpected error (e.g., NLTK issue after check)
+        return None, f"Unexpected analysis error: {str(e)}"
 
 # ==============================================================================
 # 2. TKINTER GUI APPLICATION CLASS
@@ -189,6 +206,11 @@ class DocumentAnalyzerGUI:
         master.resizable(False, False)
 
         self.file_path = ""
+        # Worker process for the analysis, created when it is first needed
+        self.executor = None
+        # Callbacks from other threads, run on the Tk thread by pump_events
+        self.events = queue.Queue()
+        self.pump_id = None
         self.style = ttk.Style()
         self.style.configure('TFrame', background='#f0f0f0')
 
@@ -196,37 +218,124 @@ class DocumentAnalyzerGUI:
         self.main_frame = ttk.Frame(master, padding="20 20 20 20")
         self.main_frame.pack(fill='both', expand=True)
 
+        # The three screens are built once and swapped with show_screen, so
+        # moving between them never destroys and recreates widgets
+        self.screen_initial = self.build_initial_screen()
+        self.screen_progress = self.build_progress_screen()
+        self.screen_result = self.build_result_screen()
+        # Report tabs by name, reused across analyses: (tab frame, Text widget)
+        self.report_tabs = {}
+
         self.initial_screen()
+        master.protocol("WM_DELETE_WINDOW", self.on_close)
 
-    def clear_frame(self):
-        """Destroys all widgets in the main frame."""
-        for widget in self.main_frame.winfo_children():
-            widget.destroy()
+        # Start the analysis process now and have it load its models in the background.
+        # A failure here is ignored; the real analysis will report it.
+        executor = self.get_executor()
+        executor.submit(warm_up_analysis).add_done_callback(
+            lambda done: self.warm_up_done(executor, done)
+        )
+        self.pump_events()
+
+    def pump_events(self):
+        """
+        Runs the callbacks other threads have queued, all in one Tk event.
+        Tk may only be used from this thread, and a single 50 ms loop copes
+        with any number of events without flooding the event queue.
+        """
+        try:
+            while True:
+                try:
+                    callback = self.events.get_nowait()
+                except queue.Empty:
+                    break
+                callback()
+        finally:
+            # A failing callback must not stop the pump, or later results
+            # would never reach the screen
+            self.pump_id = self.master.after(50, self.pump_events)
+
+    def on_close(self):
+        """
+        Stops the analysis process along with the window. shutdown() only
+        cancels queued work, so a running analysis is terminated explicitly;
+        otherwise it would keep a windowless process alive until it finished.
+        """
+        if self.pump_id is not None:
+            self.master.after_cancel(self.pump_id)
+            self.pump_id = None
+        if self.executor is not None:
+            # The pool clears its process table on shutdown, so take it first
+            processes = list((self.executor._processes or {}).values())
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            for process in processes:
+                _terminate_analysis_process(process)
+            self.executor = None
+        self.master.destroy()
+
+    def get_executor(self):
+        """
+        Returns the analysis process pool. POS tagging is CPU-bound Python, so
+        running it in a thread would fight the Tk event loop for the GIL. One
+        long-lived worker also keeps the loaded models and result cache warm.
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=1, initializer=_start_analysis_process
+            )
+        return self.executor
+
+    def discard_executor(self, executor):
+        """Drops a broken analysis process pool, so the next analysis starts a fresh one."""
+        if self.executor is executor:
+            executor.shutdown(wait=False)
+            self.executor = None
+
+    def warm_up_done(self, executor, future):
+        """
+        Done callback of the warm-up (runs on an executor thread). If the
+        worker died while loading, the pool can't run anything else.
+        """
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self.events.put(lambda: self.discard_executor(executor))
+
+    def show_screen(self, screen):
+        """Packs the given screen and hides the others."""
+        for other in (self.screen_initial, self.screen_progress, self.screen_result):
+            if other is not screen:
+                other.pack_forget()
+        screen.pack(fill='both', expand=True)
 
     # --- Screen 1: File Selection ---
-    def initial_screen(self):
-        self.clear_frame()
+    def build_initial_screen(self):
+        screen = ttk.Frame(self.main_frame)
 
         # Title
-        ttk.Label(self.main_frame, text="Document Word and Adjective Analyzer", 
+        ttk.Label(screen, text="Document Word and Adjective Analyzer", 
                   font=("Helvetica", 16, "bold")).pack(pady=20)
 
         # File path display
         self.path_var = tk.StringVar(value="No file selected.")
-        ttk.Label(self.main_frame, textvariable=self.path_var, wraplength=550, 
+        ttk.Label(screen, textvariable=self.path_var, wraplength=550, 
                   font=("Helvetica", 10)).pack(pady=10)
 
         # Browse Button
-        self.browse_button = ttk.Button(self.main_frame, text="Select Document (.pdf or .docx)", 
+        self.browse_button = ttk.Button(screen, text="Select Document (.pdf or .docx)", 
                                         command=self.browse_file, width=35)
         self.browse_button.pack(pady=10)
 
         # Analyze Button
-        self.analyze_button = ttk.Button(self.main_frame, text="Analyze Document", 
+        self.analyze_button = ttk.Button(screen, text="Analyze Document", 
                                          command=self.start_analysis, state=tk.DISABLED, width=35)
         self.analyze_button.pack(pady=20)
         
-        ttk.Label(self.main_frame, text="Powered by Python & NLTK").pack(side=tk.BOTTOM, pady=5)
+        ttk.Label(screen, text="Powered by Python & NLTK").pack(side=tk.BOTTOM, pady=5)
+        return screen
+
+    def initial_screen(self):
+        self.path_var.set("No file selected.")
+        self.analyze_button.config(state=tk.DISABLED)
+        self.show_screen(self.screen_initial)
 
 
     def browse_file(self):
@@ -245,98 +354,133 @@ class DocumentAnalyzerGUI:
             self.analyze_button.config(state=tk.DISABLED)
 
     # --- Screen 2: Analysis Animation/Progress ---
-    def start_analysis(self):
-        if not self.file_path:
-            messagebox.showerror("Error", "Please select a file before analyzing.")
-            return
-
-        self.clear_frame()
-        self.master.title("Analyzing...")
+    def build_progress_screen(self):
+        screen = ttk.Frame(self.main_frame)
 
-        ttk.Label(self.main_frame, text="Analyzing Document...", 
+        ttk.Label(screen, text="Analyzing Document...", 
                   font=("Helvetica", 16, "bold")).pack(pady=40)
 
         # Animation Placeholder (using a determinate progressbar for visual feedback)
-        self.progress_bar = ttk.Progressbar(self.main_frame, orient='horizontal', 
+        self.progress_bar = ttk.Progressbar(screen, orient='horizontal', 
                                             length=300, mode='indeterminate')
         self.progress_bar.pack(pady=20)
-        self.progress_bar.start(10) # Starts the progress animation
 
-        ttk.Label(self.main_frame, text="This may take a few moments for large files.").pack(pady=10)
+        ttk.Label(screen, text="This may take a few moments for large files.").pack(pady=10)
+        return screen
 
-        # Start analysis in a separate thread
-        analysis_thread = threading.Thread(target=self.run_analysis)
-        analysis_thread.start()
+    def start_analysis(self):
+        if not self.file_path:
+            messagebox.showerror("Error", "Please select a file before analyzing.")
+            return
 
-    def run_analysis(self):
-        """Function run in a separate thread to prevent GUI lockup."""
-        
-        # 1. Extract Text
-        document_text = get_document_text(self.file_path)
-        
-        if isinstance(document_text, str) and (document_text.startswith("Error") or document_text.startswith("Unsupported")):
-            # Analysis failed, update GUI on the main thread
-            self.master.after(0, lambda: self.show_error_result(document_text))
+        self.show_screen(self.screen_progress)
+        self.master.title("Analyzing...")
+        self.progress_bar.start(10) # Starts the progress animation
+
+        # Start analysis in a separate process. Its done callback runs on an
+        # executor thread, so it only queues the result for the Tk thread
+        executor = self.get_executor()
+        try:
+            future = executor.submit(analyze_document, self.file_path)
+        except BrokenProcessPool as e:
+            # The worker died before this analysis; start a fresh one next time
+            self.discard_executor(executor)
+            self.show_error_result(f"Unexpected analysis error: {str(e)}")
             return
-            
-        # 2. Analyze Text and Generate Chapter Reports
+        future.add_done_callback(
+            lambda done: self.events.put(lambda: self.analysis_done(executor, done))
+        )
+
+    def analysis_done(self, executor, future):
+        """Routes the finished analysis result to the right screen."""
         try:
-            # === MODIFICATION HERE ===
-            chapter_reports = analyze_by_chapter(document_text, self.file_path)
-            
-            # Analysis successful, update GUI on the main thread
-            # Pass the dictionary of reports instead of a single string
-            self.master.after(0, lambda: self.final_result_screen(chapter_reports))
-            
+            chapter_reports, error_msg = future.result()
         except Exception as e:
-            # Analysis failed due to an unexpected error (e.g., NLTK issue after check)
-            error_msg = f"Unexpected analysis error: {str(e)}"
-            self.master.after(0, lambda: self.show_error_result(error_msg))
+            # The worker process itself failed (e.g. it crashed); start a fresh one next time
+            self.discard_executor(executor)
+            chapter_reports, error_msg = None, f"Unexpected analysis error: {str(e)}"
+            
+        if error_msg:
+            self.show_error_result(error_msg)
+        else:
+            self.final_result_screen(chapter_reports)
 
     def show_error_result(self, error_msg):
         """Displays a message if analysis fails."""
         self.progress_bar.stop()
-        self.clear_frame()
-        messagebox.showerror("Analysis Failed", error_msg)
         self.initial_screen() # Return to the start screen
+        messagebox.showerror("Analysis Failed", error_msg)
 
     # --- Screen 3: Results Display (Final Screen) ---
-    def final_result_screen(self, chapter_reports):
-        self.progress_bar.stop()
-        self.clear_frame()
-        self.master.title("Analysis Results")
+    def build_result_screen(self):
+        screen = ttk.Frame(self.main_frame)
 
-        ttk.Label(self.main_frame, text="✅ Analysis Complete!", 
+        ttk.Label(screen, text="✅ Analysis Complete!", 
                   font=("Helvetica", 16, "bold"), foreground="green").pack(pady=10)
         
         # Create a Notebook (Tabbed Interface)
-        notebook = ttk.Notebook(self.main_frame)
-        notebook.pack(fill='both', expand=True, padx=5, pady=5)
-        
-        # Loop through the dictionary of reports (Chapter Name: Markdown Report)
-        for chapter_name, report_content in chapter_reports.items():
-            # Create a new frame for each tab
-            tab_frame = ttk.Frame(notebook, padding="10 10 10 10")
-            notebook.add(tab_frame, text=chapter_name)
+        self.notebook = ttk.Notebook(screen)
+        self.notebook.pack(fill='both', expand=True, padx=5, pady=5)
 
-            # Create a scrollable Text widget for the report in the tab
-            text_frame = ttk.Frame(tab_frame)
-            text_frame.pack(fill='both', expand=True)
+        # Back to Start Button
+        ttk.Button(screen, text="Analyze Another Document", 
+                   command=self.initial_screen, width=30).pack(pady=15)
+        return screen
+
+    def build_report_tab(self, chapter_name):
+        """Adds a tab holding a scrollable, read-only report Text widget."""
+        tab_frame = ttk.Frame(self.notebook, padding="10 10 10 10")
+        self.notebook.add(tab_frame, text=chapter_name)
 
-            scrollbar = ttk.Scrollbar(text_frame)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Create a scrollable Text widget for the report in the tab
+        text_frame = ttk.Frame(tab_frame)
+        text_frame.pack(fill='both', expand=True)
+
+        scrollbar = ttk.Scrollbar(text_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Read-only, so no undo stack
+        report_text = tk.Text(text_frame, wrap='word', height=15, width=70, 
+                                   yscrollcommand=scrollbar.set, font=("Courier", 10),
+                                   undo=False, autoseparators=False, state=tk.DISABLED)
+        report_text.pack(side=tk.LEFT, fill='both', expand=True)
+        
+        scrollbar.config(command=report_text.yview)
+        return tab_frame, report_text
 
-            report_text = tk.Text(text_frame, wrap='word', height=15, width=70, 
-                                       yscrollcommand=scrollbar.set, font=("Courier", 10))
-            report_text.insert(tk.END, report_content)
+    def final_result_screen(self, chapter_reports):
+        self.progress_bar.stop()
+        self.master.title("Analysis Results")
+
+        # Hide tabs the previous document had but this one doesn't
+        for chapter_name, (tab_frame, _) in self.report_tabs.items():
+            if chapter_name not in chapter_reports:
+                self.notebook.hide(tab_frame)
+        
+        # Loop through the dictionary of reports (Chapter Name: Markdown Report)
+        for chapter_name, report_content in chapter_reports.items():
+            if chapter_name in self.report_tabs:
+                tab_frame, report_text = self.report_tabs[chapter_name]
+                self.notebook.add(tab_frame) # Shows the tab again if it was hidden
+            else:
+                tab_frame, report_text = self.build_report_tab(chapter_name)
+                self.report_tabs[chapter_name] = (tab_frame, report_text)
+
+            # Swap the report in with one insert while the screen is hidden,
+            # so Tk lays it out once
+            report_text.config(state=tk.NORMAL)
+            report_text.delete('1.0', tk.END)
+            report_text.insert('1.0', report_content)
+            report_text.edit_reset()
             report_text.config(state=tk.DISABLED) # Make it read-only
-            report_text.pack(side=tk.LEFT, fill='both', expand=True)
-            
-            scrollbar.config(command=report_text.yview)
+            report_text.yview_moveto(0)
 
-        # Back to Start Button
-        ttk.Button(self.main_frame, text="Analyze Another Document", 
-                   command=self.initial_screen, width=30).pack(pady=15)
+        first_tab = self.report_tabs[next(iter(chapter_reports))][0]
+        self.notebook.select(first_tab)
+        self.show_screen(self.screen_result)
+        
+        # Settle geometry for all tabs in one pass
+        self.master.update_idletasks()
         
 # ==============================================================================
 # 3. RUN THE APPLICATION